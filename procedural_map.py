@@ -13,69 +13,332 @@ python procedural_map.py --size 120x60 --seed 123 \
                          --renderer sprite \
                          --tiles tiles.png --tile-size 16 --out map.png
 """
-import sys, argparse, random, pathlib, io
-from dataclasses import dataclass
-from typing import List
+import sys, os, re, math, argparse, random, pathlib, io, hashlib, struct, zlib
+import inspect
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from noise import pnoise2
-from PIL import Image, ImageDraw                  # ── NEW: Pillow
+try:                                   # JIT noise kernel (optional)
+    import numba as nb
+    njit, prange = nb.njit, nb.prange
+except ImportError:                    # → pure-numpy _perlin_numpy()
+    nb = None
+    def njit(*args, **kwargs): return lambda f: f
+    prange = range
+# Pillow is imported inside the sprite code only, so ASCII-only callers
+# (procedural_map_ascii.py) can use this module without it installed.
 
 # ──────────────────────────────────────────────
 # 1.  Tileset meta-model
 # ──────────────────────────────────────────────
-@dataclass(frozen=True)
-class Tile:
-    id: str
-    glyph: str
-    passable: bool
-    rc: tuple  # (row, col) on the sprite-sheet
-
-TILESET: List[Tile] = [
-    Tile("water_deep",     "~", False, (0, 0)),
-    Tile("water_shallow",  ",", False, (0, 1)),
-    Tile("sand",           ".", True,  (1, 0)),
-    Tile("plains",         "\"",True,  (1, 1)),
-    Tile("forest",         "♣", True,  (2, 0)),
-    Tile("mountain",       "^", False, (2, 1)),
-]
-
-ID2TILE   = {t.id: t for t in TILESET}
-ID2GLYPH  = {t.id: t.glyph for t in TILESET}
+# Parallel per-tile arrays; index i ⇔ terrain id i in a uint8 grid.
+# Order also sets the default glyph priority in a legend.
+TILE_IDS      = ("water_deep", "water_shallow", "sand",
+                 "plains",     "forest",        "mountain")
+TILE_GLYPHS   = np.array(["~",   ",",   ".",  "\"", "♣",  "^"  ], dtype="U1")
+TILE_PASSABLE = np.array([False, False, True, True, True, False], dtype=bool)
+# (row,col) on the sprite-sheet
+TILE_RC       = np.array([(0,0), (0,1), (1,0), (1,1), (2,0), (2,1)],
+                         dtype=np.uint8).reshape(-1, 2)
+
+GLYPHS    = TILE_GLYPHS.view(np.uint32)          # code points, same order
+
+# The same table as one record per tile id, so per-cell questions about
+# a terrain grid are a single gather, e.g. TILE_META["passable"][terrain]
+TILE_META = np.zeros(len(TILE_IDS), dtype=[("glyph", "u4"), ("passable", "?"),
+                                           ("row", "u1"), ("col", "u1")])
+TILE_META["glyph"]    = GLYPHS
+TILE_META["passable"] = TILE_PASSABLE
+TILE_META["row"], TILE_META["col"] = TILE_RC.T
+
+def passable_grid(terrain):
+    """(h, w) bool grid, True wherever the terrain tile is walkable."""
+    return TILE_META["passable"][terrain]
+
+# glyph tables the ASCII renderer applies to the whole terrain grid.
+# All-ASCII tilesets go through one bytes.translate() over the raw ids
+# (id 255 marks row ends); otherwise ('♣') gather UTF-32 code points.
+GLYPH_LUT = GLYPHS.astype("<u4")
+ROW_END   = 255
+
+def _translate_table(glyphs):
+    """bytes.translate() table for code points `glyphs`, or None."""
+    if len(glyphs) > ROW_END or glyphs.max() >= 0x80:
+        return None
+    table = bytearray(range(256))
+    table[:len(glyphs)] = glyphs.astype(np.uint8).tobytes()
+    table[ROW_END] = ord("\n")
+    return bytes(table)
+
+TRANSLATE = _translate_table(GLYPHS)
+
+# height band = number of thresholds reached (0..4) → tile index;
+# band 3 is split into plains/forest by moisture
+HEIGHT_BANDS = [0.35, 0.42, 0.45, 0.70]
+BAND2ID      = np.array([TILE_IDS.index(n) for n in
+                         ("water_deep", "water_shallow", "sand",
+                          "plains", "mountain")], dtype=np.uint8)
+FOREST_ID    = TILE_IDS.index("forest")
+
+# noise-space scale (tiles per lattice cell) and offset of each layer
+HEIGHT_SCALE              = 60.0
+MOIST_SCALE, MOIST_OFFSET = 120.0, 999.0
 
 # ──────────────────────────────────────────────
-# 2.  Terrain generator (unchanged)
+# 2.  Terrain generator
 # ──────────────────────────────────────────────
+# Classic gradient noise: 8 lattice gradients, 512-entry doubled
+# permutation table (seeded), quintic fade.  Compiled once by numba;
+# _perlin_numpy() evaluates the same field with numpy when it's absent.
+_GRAD2 = np.array([[ 1, 1], [-1, 1], [ 1,-1], [-1,-1],
+                   [ 1, 0], [-1, 0], [ 0, 1], [ 0,-1]], dtype=np.float64)
+
+def _permutation(seed):
+    if seed < 0:                      # default_rng only takes seeds >= 0
+        seed %= 2**64
+    perm = np.random.default_rng(seed).permutation(256).astype(np.uint8)
+    return np.concatenate([perm, perm])
+
+@njit(cache=True, fastmath=True)
+def _fade(t):
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+@njit(cache=True, fastmath=True)
+def _grad(hash_, x, y):
+    g = _GRAD2[hash_ & 7]
+    return g[0] * x + g[1] * y
+
+@njit(cache=True, fastmath=True)
+def _perlin(x, y, perm):
+    x0, y0 = np.floor(x), np.floor(y)
+    xi, yi = int(x0) & 255, int(y0) & 255
+    x -= x0
+    y -= y0
+    u, v = _fade(x), _fade(y)
+    a, b = perm[xi] + yi, perm[xi + 1] + yi
+    n0 = _grad(perm[a],     x,       y)
+    n1 = _grad(perm[b],     x - 1.0, y)
+    n2 = _grad(perm[a + 1], x,       y - 1.0)
+    n3 = _grad(perm[b + 1], x - 1.0, y - 1.0)
+    top = n0 + u * (n1 - n0)
+    bot = n2 + u * (n3 - n2)
+    return top + v * (bot - top)
+
+@njit(cache=True, fastmath=True)
+def _fbm(x, y, perm, octaves):
+    total, amp, freq, norm = 0.0, 1.0, 1.0, 0.0
+    for _ in range(octaves):
+        total += amp * _perlin(x * freq, y * freq, perm)
+        norm += amp
+        amp  *= 0.5
+        freq *= 2.0
+    return total / norm
+
+@njit(parallel=True, fastmath=True, cache=True)
+def perlin_grid(w, h, scale, offset, perm, octaves, out):
+    """
+    Fill out[h, w] with fractal Perlin noise (frequency ×2, amplitude
+    ×0.5 per octave), rows spread across threads.  Roughly ±0.5.
+    """
+    for y in prange(h):
+        for x in range(w):
+            out[y, x] = _fbm((x + offset) / scale, (y + offset) / scale,
+                             perm, octaves)
+    return out
+
+@njit(parallel=True, fastmath=True, cache=True)
+def classify_grid(w, h, perm, octaves, height_scale, moist_scale,
+                  moist_offset, bands, band2id, forest_id, out):
+    """
+    Fused noise + biome pass: per tile, sample height, pick its band and
+    write the uint8 tile id to out[h, w].  No float grids are built, and
+    moisture is only sampled on the plains band where it decides forest.
+    """
+    for y in prange(h):
+        for x in range(w):
+            hv = _fbm(x / height_scale, y / height_scale, perm, octaves) + 0.5
+            band = 0
+            for t in bands:
+                band += hv >= t
+            tile = band2id[band]
+            if band == 3:
+                mv = _fbm((x + moist_offset) / moist_scale,
+                          (y + moist_offset) / moist_scale,
+                          perm, octaves) + 0.5
+                if mv >= 0.5:
+                    tile = forest_id
+            out[y, x] = tile
+    return out
+
+_BANDS = np.asarray(HEIGHT_BANDS, dtype=np.float64)
+
+# compile at import so the first generate() isn't paying for the JIT
+if nb is not None:
+    perlin_grid(1, 1, 1.0, 0.0, _permutation(0), 1, np.empty((1, 1)))
+    classify_grid(1, 1, _permutation(0), 1, 1.0, 1.0, 0.0,
+                  _BANDS, BAND2ID, FOREST_ID, np.empty((1, 1), dtype=np.uint8))
+
+def _grad_np(hash_, x, y):
+    g = _GRAD2[hash_ & 7]
+    return g[..., 0] * x + g[..., 1] * y
+
+def _perlin_numpy(xs, ys, perm, octaves):
+    """
+    Vectorised twin of perlin_grid(): same lattice, gradients and octave
+    sum over the (len(ys), len(xs)) grid of noise-space coordinates.
+    """
+    perm  = perm.astype(np.intp)
+    total = np.zeros((len(ys), len(xs)))
+    amp, freq, norm = 1.0, 1.0, 0.0
+    for _ in range(octaves):
+        x, y   = xs * freq, ys * freq
+        x0, y0 = np.floor(x), np.floor(y)
+        xi = x0.astype(np.intp) & 255
+        yi = (y0.astype(np.intp) & 255)[:, None]
+        x, y = x - x0, (y - y0)[:, None]
+        u = x * x * x * (x * (x * 6.0 - 15.0) + 10.0)
+        v = y * y * y * (y * (y * 6.0 - 15.0) + 10.0)
+        a, b = perm[xi] + yi, perm[xi + 1] + yi
+        n0 = _grad_np(perm[a],     x,       y)
+        n1 = _grad_np(perm[b],     x - 1.0, y)
+        n2 = _grad_np(perm[a + 1], x,       y - 1.0)
+        n3 = _grad_np(perm[b + 1], x - 1.0, y - 1.0)
+        top = n0 + u * (n1 - n0)
+        bot = n2 + u * (n3 - n2)
+        total += amp * (top + v * (bot - top))
+        norm += amp
+        amp  *= 0.5
+        freq *= 2.0
+    return total / norm
+
+def _upsample(lo, k, w, h):
+    """
+    Bilinearly stretch a coarse noise grid sampled every `k` tiles back
+    to (h, w).  `lo` must cover w//k + 2 columns and h//k + 2 rows.
+    """
+    fx, fy = np.arange(w) / k, np.arange(h) / k
+    x0, y0 = fx.astype(np.intp), fy.astype(np.intp)
+    tx, ty = fx - x0, (fy - y0)[:, None]
+    rows = lo[:, x0] * (1.0 - tx) + lo[:, x0 + 1] * tx
+    return rows[y0] * (1.0 - ty) + rows[y0 + 1] * ty
+
+# Generated terrains can be cached as .npy files here (opt-in), keyed by
+# the generator arguments plus _generator_fingerprint().  Nothing evicts
+# old files; delete the directory to reclaim the space.
+CACHE_DIR = pathlib.Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")
+                         ).expanduser() / "mapscii"
+
+def _generator_fingerprint():
+    """
+    Digest of the generator source and the tables/constants it reads,
+    so editing any of them changes every cache key instead of serving
+    terrain built by the old code.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for f in (_permutation, _fade, _grad, _perlin, _fbm, perlin_grid,
+              classify_grid, _grad_np, _perlin_numpy, _upsample,
+              TerrainGenerator):
+        h.update(inspect.getsource(getattr(f, "py_func", f)).encode())
+    h.update(repr((TILE_IDS, HEIGHT_BANDS, BAND2ID.tolist(), FOREST_ID,
+                   HEIGHT_SCALE, MOIST_SCALE, MOIST_OFFSET,
+                   _GRAD2.tolist())).encode())
+    return h.hexdigest()
+
 class TerrainGenerator:
-    def __init__(self, width, height, seed, octaves=4):
+    def __init__(self, width, height, seed, octaves=4, coarse=1,
+                 workers=None, cache_dir=None):
+        if coarse < 1:
+            raise ValueError(f"coarse must be >= 1 (got {coarse})")
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be >= 1 (got {workers})")
         self.w, self.h, self.seed, self.oct = width, height, seed, octaves
+        self.coarse  = coarse   # sample noise every N tiles, interpolate
+        # threads sharing rows of the noise grid
+        self.workers = os.cpu_count() if workers is None else workers
+        self.cache_dir = cache_dir     # None → always regenerate
         random.seed(seed)
+        self.perm = _permutation(seed)
 
-    def _noise(self, x, y, scale, offset=0):
-        return pnoise2((x+offset)/scale, (y+offset)/scale,
-                       octaves=self.oct, repeatx=1024, repeaty=1024,
-                       base=self.seed)
+    def _numba_threads(self):
+        nb.set_num_threads(min(self.workers, nb.config.NUMBA_NUM_THREADS))
+
+    def _grid(self, w, h, scale, offset):
+        if nb is None:
+            # numpy releases the GIL inside ufuncs, so row bands overlap
+            xs = (np.arange(w) + offset) / scale
+            ys = (np.arange(h) + offset) / scale
+            with ThreadPoolExecutor(self.workers) as pool:
+                bands = pool.map(
+                    lambda band: _perlin_numpy(xs, band, self.perm, self.oct),
+                    np.array_split(ys, max(1, min(self.workers, h))))
+                return np.vstack(list(bands))
+        self._numba_threads()
+        return perlin_grid(w, h, float(scale), float(offset),
+                           self.perm, self.oct, np.empty((h, w)))
+
+    def _fractal(self, scale, offset=0):
+        k = self.coarse
+        if k == 1:
+            return self._grid(self.w, self.h, scale, offset)
+        # k× fewer samples per axis; lattice point i sits at tile i*k
+        lw, lh = self.w // k + 2, self.h // k + 2
+        lo = self._grid(lw, lh, scale / k, offset / k)
+        return _upsample(lo, k, self.w, self.h)
+
+    def _cache_path(self):
+        key = (f"{_generator_fingerprint()}-{self.seed}-{self.w}-{self.h}-"
+               f"{self.oct}-{self.coarse}")
+        digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        return pathlib.Path(self.cache_dir) / f"{digest}.npy"
 
     def generate(self):
-        height_map   = np.zeros((self.h, self.w))
-        moisture_map = np.zeros((self.h, self.w))
+        """
+        Return the (h, w) uint8 terrain grid.  With a cache_dir, a grid
+        generated earlier is memory-mapped instead of rebuilt.  With or
+        without the cache the grid is read-only; .copy() it to edit.
+        """
+        if self.cache_dir is None:
+            terrain = self._generate()
+            terrain.setflags(write=False)
+            return terrain
+        path = self._cache_path()
+        if path.exists():
+            try:
+                terrain = np.load(path, mmap_mode="r")
+            except (ValueError, EOFError):   # truncated / not an .npy
+                terrain = None
+            if (terrain is not None and terrain.shape == (self.h, self.w)
+                    and terrain.dtype == np.uint8):
+                return terrain
+            # anything else is rebuilt and overwritten below
+        terrain = self._generate()
+        terrain.setflags(write=False)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, terrain)
+        os.replace(tmp, path)        # readers never see a partial file
+        return terrain
 
-        for y in range(self.h):
-            for x in range(self.w):
-                height_map[y,x]   = self._noise(x,y,  60)
-                moisture_map[y,x] = self._noise(x,y, 120, offset=999)
+    def _generate(self):
+        if nb is not None and self.coarse == 1:
+            self._numba_threads()
+            out = np.empty((self.h, self.w), dtype=np.uint8)
+            return classify_grid(self.w, self.h, self.perm, self.oct,
+                                 HEIGHT_SCALE, MOIST_SCALE, MOIST_OFFSET,
+                                 _BANDS, BAND2ID, FOREST_ID, out)
+
+        height_map   = self._fractal(HEIGHT_SCALE)
+        moisture_map = self._fractal(MOIST_SCALE, offset=MOIST_OFFSET)
 
         height_map   = (height_map   + 0.5)
         moisture_map = (moisture_map + 0.5)
 
-        terrain = [["" for _ in range(self.w)] for _ in range(self.h)]
-        for y in range(self.h):
-            for x in range(self.w):
-                h, m = height_map[y,x], moisture_map[y,x]
-                if h < 0.35:   terrain[y][x] = "water_deep"
-                elif h < 0.42: terrain[y][x] = "water_shallow"
-                elif h < 0.45: terrain[y][x] = "sand"
-                elif h < 0.70: terrain[y][x] = "plains" if m < 0.5 else "forest"
-                else:          terrain[y][x] = "mountain"
+        # branch-free banding: sum one streaming compare per threshold
+        band = np.zeros(height_map.shape, dtype=np.uint8)
+        for t in HEIGHT_BANDS:
+            band += (height_map >= t).view(np.uint8)
+        terrain = np.where((band == 3) & (moisture_map >= 0.5),
+                           np.uint8(FOREST_ID), BAND2ID[band])
         return terrain
 
 # ──────────────────────────────────────────────
@@ -84,45 +347,128 @@ class TerrainGenerator:
 class AsciiRenderer:
     def __init__(self, terrain): self.terrain = terrain
     def render(self):            # returns str
-        return "\n".join(
-            "".join(ID2GLYPH[id_] for id_ in row)
-            for row in self.terrain
-        )
+        h = self.terrain.shape[0]
+        if TRANSLATE is not None:
+            # translate() passes unknown ids through; fail like the gather
+            top = int(self.terrain.max()) if self.terrain.size else 0
+            if top >= len(GLYPHS):
+                raise IndexError(f"terrain id {top} is out of bounds for "
+                                 f"{len(GLYPHS)} tiles")
+            nl   = np.full((h, 1), ROW_END, dtype=np.uint8)
+            rows = np.hstack([self.terrain, nl])
+            return rows.tobytes().translate(TRANSLATE)[:-1].decode("ascii")
+        # gather code points into an (h, w+1) UTF-32 canvas whose last
+        # column is '\n', then decode the buffer without a bytes copy
+        w   = self.terrain.shape[1]
+        cps = np.empty((h, w + 1), dtype=GLYPH_LUT.dtype)
+        cps[:, w]  = ord("\n")
+        cps[:, :w] = GLYPH_LUT[self.terrain]    # IndexError on bad ids
+        return str(cps.reshape(-1)[:-1].data, "utf-32-le")
+
+def _png_chunk(f, tag, data):
+    f.write(struct.pack(">I", len(data)))
+    f.write(tag)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(tag))))
+
+def write_png_rgba(path, width, height, stripes):
+    """
+    Stream an 8-bit RGBA PNG to `path` from (n, width, 4) uint8 row
+    stripes, top to bottom, so only one stripe is in memory at a time.
+    Rows use the Sub filter, which packs flat sprite colours well.
+    """
+    if width < 1 or height < 1:
+        raise ValueError(f"PNG size must be at least 1x1 "
+                         f"(got {width}x{height})")
+    z = zlib.compressobj(6)
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        _png_chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height,
+                                           8, 6, 0, 0, 0))   # 8-bit RGBA
+        for stripe in stripes:
+            rows = stripe.reshape(len(stripe), width * 4)
+            filt = np.empty((len(rows), width * 4 + 1), dtype=np.uint8)
+            filt[:, 0]   = 1                               # Sub
+            filt[:, 1:5] = rows[:, :4]
+            np.subtract(rows[:, 4:], rows[:, :-4], out=filt[:, 5:])
+            data = z.compress(filt)
+            if data:
+                _png_chunk(f, b"IDAT", data)
+        _png_chunk(f, b"IDAT", z.flush())
+        _png_chunk(f, b"IEND", b"")
 
 class SpriteRenderer:
     """
-    Renders terrain[][] → PNG file using a sprite-sheet laid out in
-    a uniform grid.  The TILESET list provides (row,col) coordinates.
+    Renders a uint8 terrain grid → PNG file using a sprite-sheet laid
+    out in a uniform grid.  TILE_RC provides the (row,col) coordinates.
     """
+    BLOCK_BYTES = 1 << 20    # output bytes gathered per render block
+
+    # (sheet path, mtime, tile_size) → read-only (N, ts, ts, 4) stack,
+    # shared by every renderer so batch runs decode the PNG only once
+    _sheet_cache: dict = {}
+
     def __init__(self, terrain, sheet_path, tile_size):
         self.terrain    = terrain
         self.tile_size  = tile_size
-        self.sheet_img  = Image.open(sheet_path).convert("RGBA")
-        self.id2sprite  = self._slice_sheet()
+        key = (str(sheet_path), os.path.getmtime(sheet_path), tile_size)
+        stack = SpriteRenderer._sheet_cache.get(key)
+        if stack is None:
+            from PIL import Image
+            stack = self._slice_sheet(Image.open(sheet_path).convert("RGBA"))
+            stack.setflags(write=False)
+            SpriteRenderer._sheet_cache[key] = stack
+        self.sprite_stack = stack
 
-    def _slice_sheet(self):
+    def _slice_sheet(self, sheet_img):
         """
-        Build {terrain_id: Image} by cropping the sheet once.
+        Crop every tile's sprite once and stack them (N, ts, ts, 4) in
+        tile-id order, so terrain ids index the stack directly.
         """
         tile_w = tile_h = self.tile_size
-        sprites = {}
-        for tile in TILESET:
-            r, c = tile.rc
+        sprites = []
+        for r, c in TILE_RC.tolist():
             x0, y0 = c * tile_w, r * tile_h
-            sprites[tile.id] = self.sheet_img.crop(
+            sprites.append(np.asarray(sheet_img.crop(
                 (x0, y0, x0 + tile_w, y0 + tile_h)
-            )
-        return sprites
+            )))
+        return np.stack(sprites)
+
+    def _stripes(self):
+        """
+        Yield the canvas top to bottom as (n·ts, w·ts, 4) stripes of
+        whole tile rows, ~BLOCK_BYTES each (at least one tile row).
+        """
+        h, w = self.terrain.shape
+        ts = self.tile_size
+        n = max(1, self.BLOCK_BYTES // (w * ts * ts * 4))
+        for y in range(0, h, n):
+            tiles = self.sprite_stack[self.terrain[y:y + n]]  # (n,w,ts,ts,4)
+            yield tiles.transpose(0, 2, 1, 3, 4).reshape(-1, w * ts, 4)
 
     def render(self, out_path):
-        h, w = len(self.terrain), len(self.terrain[0])
-        canvas = Image.new("RGBA", (w * self.tile_size,
-                                    h * self.tile_size))
-        for y, row in enumerate(self.terrain):
-            for x, id_ in enumerate(row):
-                canvas.paste(self.id2sprite[id_],
-                             (x * self.tile_size, y * self.tile_size))
-        canvas.save(out_path)
+        h, w = self.terrain.shape
+        ts = self.tile_size
+        if not (h and w and ts):
+            raise ValueError(f"cannot render an empty {w}x{h} map "
+                             f"of {ts}px tiles")
+        if pathlib.Path(out_path).suffix.lower() == ".png":
+            # peak memory is one stripe, not the whole canvas
+            write_png_rgba(out_path, w * ts, h * ts, self._stripes())
+            return out_path
+
+        # other formats go through Pillow, which wants the full canvas
+        from PIL import Image
+        img = np.empty((h * ts, w * ts, 4), dtype=np.uint8)
+        out = img.reshape(h, ts, w, ts, 4)              # view, tile-major
+        # square blocks of ~BLOCK_BYTES so each gather stays cache-sized
+        blk = max(1, math.isqrt(self.BLOCK_BYTES // (ts * ts * 4)))
+        for by in range(0, h, blk):
+            for bx in range(0, w, blk):
+                ids = self.terrain[by:by + blk, bx:bx + blk]
+                out[by:by + blk, :, bx:bx + blk] = \
+                    self.sprite_stack[ids].transpose(0, 2, 1, 3, 4)
+        Image.fromarray(img).save(out_path)
         return out_path
 
 # ──────────────────────────────────────────────
@@ -133,6 +479,7 @@ def make_placeholder_sheet(path: pathlib.Path, tile_size: int = 16):
     Creates a tiny 3×2 grid of colored squares so you can try the
     SpriteRenderer immediately.  Delete once you have real art.
     """
+    from PIL import Image, ImageDraw
     colors = {
         "water_deep":    (30,  60,160),
         "water_shallow": (60, 120,200),
@@ -141,24 +488,31 @@ def make_placeholder_sheet(path: pathlib.Path, tile_size: int = 16):
         "forest":        ( 20,120, 20),
         "mountain":      (120,120,120),
     }
-    cols = max(t.rc[1] for t in TILESET)+1
-    rows = max(t.rc[0] for t in TILESET)+1
+    rows, cols = (TILE_RC.max(axis=0) + 1).tolist()
     sheet = Image.new("RGBA", (cols*tile_size, rows*tile_size))
     draw  = ImageDraw.Draw(sheet)
-    for tile in TILESET:
-        r,c = tile.rc
+    for id_, (r,c) in zip(TILE_IDS, TILE_RC.tolist()):
         x0,y0 = c*tile_size, r*tile_size
         draw.rectangle([x0,y0,x0+tile_size,y0+tile_size],
-                       fill=colors[tile.id])
+                       fill=colors[id_])
     sheet.save(path)
 
 # ──────────────────────────────────────────────
 # 5.  CLI
 # ──────────────────────────────────────────────
+_SIZE_RE = re.compile(r"(\d+)x(\d+)", re.I)
+
 def main(argv):
     p = argparse.ArgumentParser()
     p.add_argument("--size", default="100x60")
     p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--coarse", type=int, default=1,
+                   help="sample noise every N tiles and interpolate "
+                        "(N=4 is ~16x fewer noise samples)")
+    p.add_argument("--workers", type=int, default=None,
+                   help="threads for noise generation (default: all CPUs)")
+    p.add_argument("--cache", action="store_true",
+                   help=f"reuse maps generated earlier, kept in {CACHE_DIR}")
 
     # renderer options
     p.add_argument("--renderer", choices=("ascii","sprite"),
@@ -170,8 +524,20 @@ def main(argv):
 
     args = p.parse_args(argv)
 
-    w,h = map(int, args.size.lower().split("x"))
-    terrain = TerrainGenerator(w, h, args.seed).generate()
+    m = _SIZE_RE.fullmatch(args.size)
+    if m is None:
+        p.error(f"--size must be WIDTHxHEIGHT, e.g. 120x60 (got {args.size!r})")
+    w, h = int(m[1]), int(m[2])
+    if args.renderer == "sprite" and not (w and h):
+        p.error(f"--size must be at least 1x1 for sprites (got {args.size})")
+    if args.coarse < 1:
+        p.error(f"--coarse must be >= 1 (got {args.coarse})")
+    if args.workers is not None and args.workers < 1:
+        p.error(f"--workers must be >= 1 (got {args.workers})")
+    terrain = TerrainGenerator(w, h, args.seed, coarse=args.coarse,
+                               workers=args.workers,
+                               cache_dir=CACHE_DIR if args.cache else None
+                               ).generate()
 
     if args.renderer == "ascii":
         print(AsciiRenderer(terrain).render())
@@ -0,0 +1,4 @@
+import pathlib, sys
+
+# the scripts live at the repo root, not in an installed package
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
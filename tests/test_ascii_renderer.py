@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+import procedural_map as pm
+
+ASCII_GLYPHS = np.array(["~", ",", ".", "\"", "T", "^"], dtype="U1")
+
+
+@pytest.fixture(params=["translate", "utf32"])
+def ascii_tileset(request, monkeypatch):
+    """Swap in an all-ASCII glyph table; run each test on both paths."""
+    glyphs = ASCII_GLYPHS.view(np.uint32)
+    monkeypatch.setattr(pm, "GLYPHS", glyphs)
+    monkeypatch.setattr(pm, "GLYPH_LUT", glyphs.astype("<u4"))
+    monkeypatch.setattr(pm, "TRANSLATE", pm._translate_table(glyphs)
+                        if request.param == "translate" else None)
+    return request.param
+
+
+def test_render_matches_glyph_table(ascii_tileset):
+    terrain = np.array([[0, 1, 2], [3, 4, 5]], dtype=np.uint8)
+    assert pm.AsciiRenderer(terrain).render() == "~,.\n\"T^"
+
+
+@pytest.mark.parametrize("bad_id", [6, 200, pm.ROW_END])
+def test_unknown_tile_id_raises(ascii_tileset, bad_id):
+    terrain = np.array([[0, bad_id], [1, 2]], dtype=np.uint8)
+    with pytest.raises(IndexError):
+        pm.AsciiRenderer(terrain).render()
+
+
+def test_default_tileset_uses_utf32_path():
+    assert pm.TRANSLATE is None              # '♣' isn't ASCII
+    terrain = np.arange(6, dtype=np.uint8).reshape(2, 3)
+    assert pm.AsciiRenderer(terrain).render() == "~,.\n\"♣^"
@@ -0,0 +1,29 @@
+import numpy as np
+
+import procedural_map as pm
+
+
+def test_cache_hit_matches_fresh_grid(tmp_path):
+    fresh = pm.TerrainGenerator(40, 20, 7).generate()
+    first = pm.TerrainGenerator(40, 20, 7, cache_dir=tmp_path).generate()
+    again = pm.TerrainGenerator(40, 20, 7, cache_dir=tmp_path).generate()
+    assert isinstance(again, np.memmap)
+    np.testing.assert_array_equal(first, fresh)
+    np.testing.assert_array_equal(again, fresh)
+
+
+def test_key_tracks_generation_constants(monkeypatch, tmp_path):
+    gen = pm.TerrainGenerator(40, 20, 7, cache_dir=tmp_path)
+    before = gen._cache_path()
+    monkeypatch.setattr(pm, "HEIGHT_BANDS", [0.3, 0.42, 0.45, 0.70])
+    assert gen._cache_path() != before
+
+
+def test_mismatched_cache_file_is_rebuilt(tmp_path):
+    gen = pm.TerrainGenerator(40, 20, 7, cache_dir=tmp_path)
+    expected = gen.generate()
+    path = gen._cache_path()
+    np.save(path, np.zeros((3, 3), dtype=np.int64))
+    np.testing.assert_array_equal(gen.generate(), expected)
+    path.write_bytes(b"")
+    np.testing.assert_array_equal(gen.generate(), expected)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+import procedural_map as pm
+
+TS = 8
+
+
+@pytest.fixture
+def sheet(tmp_path):
+    path = tmp_path / "tiles.png"
+    pm.make_placeholder_sheet(path, TS)
+    return path
+
+
+@pytest.fixture
+def terrain():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, len(pm.TILE_IDS), size=(13, 21), dtype=np.uint8)
+
+
+def expected_canvas(renderer):
+    h, w = renderer.terrain.shape
+    tiles = renderer.sprite_stack[renderer.terrain]     # (h, w, ts, ts, 4)
+    return tiles.transpose(0, 2, 1, 3, 4).reshape(h * TS, w * TS, 4)
+
+
+@pytest.mark.parametrize("block_bytes", [1, 1 << 20])
+def test_png_matches_pillow_bmp_and_sprite_stack(monkeypatch, tmp_path,
+                                                 sheet, terrain, block_bytes):
+    # 1 byte → one tile row per PNG stripe and 1x1 Pillow blocks
+    monkeypatch.setattr(pm.SpriteRenderer, "BLOCK_BYTES", block_bytes)
+    r = pm.SpriteRenderer(terrain, sheet, TS)
+    png = np.asarray(Image.open(r.render(tmp_path / "map.png")))
+    bmp = np.asarray(Image.open(r.render(tmp_path / "map.bmp")))
+    expected = expected_canvas(r)
+    np.testing.assert_array_equal(png, expected)
+    np.testing.assert_array_equal(bmp, expected[..., :3])   # BMP is RGB
+
+
+@pytest.mark.parametrize("shape", [(0, 5), (5, 0)])
+def test_empty_map_raises(tmp_path, sheet, shape):
+    r = pm.SpriteRenderer(np.zeros(shape, dtype=np.uint8), sheet, TS)
+    with pytest.raises(ValueError):
+        r.render(tmp_path / "map.png")
+    assert not (tmp_path / "map.png").exists()
+
+
+def test_write_png_rgba_rejects_empty_image(tmp_path):
+    with pytest.raises(ValueError):
+        pm.write_png_rgba(tmp_path / "map.png", 0, 4, iter(()))